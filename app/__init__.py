@@ -1,21 +1,19 @@
 from flask import Flask
 from .extensions import db, migrate, bcrypt, jwt, ma, cors, limiter
+from .errors import register_error_handlers
 from .routes import register_blueprints
+from config import config_dict, get_config
 
 def create_app(config_object=None):
     app = Flask(__name__, instance_relative_config=True)
 
     # 1. LOAD CONFIGURATION FIRST
     # ---------------------------
-    # Try to use config.py from project root if present
-    app.config.from_object('config.ProductionConfig') if not app.config.get('TESTING') else None
-    try:
-        app.config.from_pyfile('../config.py', silent=True)
-    except Exception:
-        try:
-            app.config.from_pyfile('config.py', silent=True)
-        except Exception:
-            pass
+    # config.py at the project root is the single source of settings; it is
+    # imported (and evaluated) once and shared through sys.modules.
+    # The class is picked from FLASK_ENV so dev/testing get their own settings
+    # (DB URI, engine options) before any extension is initialized below.
+    app.config.update(config_dict(get_config()))
 
     if config_object:
         app.config.from_object(config_object)
@@ -37,18 +35,11 @@ def create_app(config_object=None):
 
     # 4. REGISTER BLUEPRINTS (ROUTES)
     # -------------------------------
-    try:
-        register_blueprints(app)
-    except Exception as e:
-        print(f"Error registering blueprints: {e}")
+    register_blueprints(app)
 
     # 5. REGISTER ERROR HANDLERS
     # --------------------------
-    try:
-        from .errors import register_error_handlers
-        register_error_handlers(app)
-    except Exception:
-        pass
+    register_error_handlers(app)
 
     # 6. HEALTH CHECK ROUTE
     # ---------------------
@@ -99,3 +99,34 @@ class ServiceError(AppError):
     default_message = "Service error"
     default_status = 400
     default_code = "service_error"
+
+
+# Flask integration -----------------------------------------------------------
+
+
+def register_error_handlers(app) -> None:
+    """Render AppError (and subclasses) and HTTP errors using the standard error envelope."""
+    from werkzeug.exceptions import HTTPException
+
+    from app.utils.response import error_response
+
+    @app.errorhandler(AppError)
+    def handle_app_error(error: AppError):
+        if isinstance(error, ServiceError):
+            # Service messages wrap raw DB exceptions (SQL, parameters); log them, never return them.
+            app.logger.error("%s: %s", error.__class__.__name__, error.message)
+            return error_response(error.default_message, error.status_code, code=error.code)
+        return error_response(error.message, error.status_code, code=error.code, details=error.details)
+
+    @app.errorhandler(HTTPException)
+    def handle_http_exception(error: HTTPException):
+        resp, status = error_response(
+            error.description, error.code or 500, code=(error.name or "").lower().replace(" ", "_")
+        )
+        # Keep headers werkzeug attaches (e.g. Allow on 405), but not its HTML body headers.
+        resp.headers.extend(
+            (name, value)
+            for name, value in error.get_headers()
+            if name.lower() not in ("content-type", "content-length")
+        )
+        return resp, status
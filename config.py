@@ -1,68 +1,146 @@
 import os
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+from urllib.parse import urlsplit
 
 BASE_DIR = Path(__file__).resolve().parent
 
+# Single reference to the process environment; every lookup below goes through it.
+_ENV = os.environ
+
+
+def _env(key, default=None, cast=None):
+    """Read an environment variable, optionally casting it (e.g. int).
+
+    Blank values count as unset only when a cast is given; uncast values
+    (secrets included) are returned as-is.
+    """
+    value = _ENV.get(key, default)
+    if cast and value in (None, ""):
+        value = default
+    return cast(value) if cast and value is not None else value
+
+
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+
+def _bool_env(key, default=False):
+    """True if the value is one of _TRUTHY; unset/blank -> default."""
+    value = _ENV.get(key)
+    if not value:
+        return default
+    return value.strip().lower() in _TRUTHY
+
+
+# Legacy scheme -> SQLAlchemy dialect scheme. At most one prefix can match.
+_SCHEME_MAP = (
+    ("postgres://", "postgresql://"),
+    ("mysql://", "mysql+pymysql://"),
+)
+
+
+def _normalize_database_url(url):
+    """Fix for Postgres/MySQL prefixes if needed."""
+    for prefix, replacement in _SCHEME_MAP:
+        if url.startswith(prefix):
+            return replacement + url[len(prefix):]
+    return url
+
+
+# Database Connection Logic (resolved once at import, shared by every config class)
+# We check ALL possible variable names to be safe.
+# Priority: MYSQL_URL (Railway) -> DATABASE_URL (Standard) -> DATABASE_URI (Local)
+_DB_URL = _env('MYSQL_URL') or _env('DATABASE_URL') or _env('DATABASE_URI')
+if _DB_URL:
+    _DB_URL = _normalize_database_url(_DB_URL)
+
+
+def _sqlite_dev_uri():
+    """Local SQLite fallback, only built when no database URL is configured."""
+    return f"sqlite:///{(BASE_DIR / 'instance' / 'ecommerce_dev.db')}"
+
+
+@lru_cache(maxsize=8)
+def _db_name(uri):
+    """Database name from a SQLAlchemy URI, ignoring any ?query options."""
+    return urlsplit(uri).path.rsplit("/", 1)[-1]
+
+
+# Read-only so the classes can share one mapping without copying it.
+# pool_recycle retires connections before the server/proxy drops them idle,
+# so pool_pre_ping rarely has to reconnect on checkout.
+_ENGINE_OPTIONS = MappingProxyType({
+    "pool_pre_ping": True,
+    "pool_recycle": _env('SQLALCHEMY_POOL_RECYCLE', 300, int),
+})
+
+
 class Config:
     # 1. Security Keys
-    SECRET_KEY = os.environ.get('SECRET_KEY', 'dev-key-please-change')
-    JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY', 'jwt-key-please-change')
-
-    # 2. Database Connection Logic
-    # We check ALL possible variable names to be safe.
-    # Priority: MYSQL_URL (Railway) -> DATABASE_URL (Standard) -> DATABASE_URI (Local)
-    _db_url = (
-        os.environ.get('MYSQL_URL') or 
-        os.environ.get('DATABASE_URL') or 
-        os.environ.get('DATABASE_URI')
-    )
-
-    # Fix for Postgres/MySQL prefixes if needed
-    if _db_url:
-        if _db_url.startswith("postgres://"):
-            _db_url = _db_url.replace("postgres://", "postgresql://", 1)
-        if _db_url.startswith("mysql://"):
-            _db_url = _db_url.replace("mysql://", "mysql+pymysql://", 1)
+    SECRET_KEY = _env('SECRET_KEY', 'dev-key-please-change')
+    JWT_SECRET_KEY = _env('JWT_SECRET_KEY', 'jwt-key-please-change')
 
+    # 2. Database
     # Set the final URI. If no cloud DB found, use local SQLite.
-    SQLALCHEMY_DATABASE_URI = _db_url or f"sqlite:///{(BASE_DIR / 'instance' / 'ecommerce_dev.db')}"
-    
+    SQLALCHEMY_DATABASE_URI = _DB_URL or _sqlite_dev_uri()
+
     SQLALCHEMY_TRACK_MODIFICATIONS = False
-    
+    # Log every SQL statement (set SQLALCHEMY_ECHO=1 when debugging queries)
+    SQLALCHEMY_ECHO = _bool_env('SQLALCHEMY_ECHO')
+
     # 3. Other Settings
     JWT_ACCESS_TOKEN_EXPIRES = 3600  # 1 hour
     PROPAGATE_EXCEPTIONS = True
-    
+
     # SQLAlchemy options
-    SQLALCHEMY_ENGINE_OPTIONS = {
-        "pool_pre_ping": True,
-        "pool_recycle": 300,
-    }
+    SQLALCHEMY_ENGINE_OPTIONS = _ENGINE_OPTIONS
+
+    @classmethod
+    def get_db_name(cls):
+        return _db_name(cls.SQLALCHEMY_DATABASE_URI)
 
 
 class ProductionConfig(Config):
     DEBUG = False
     TESTING = False
-    # In production, we force it to use the Parent Config's URI logic
-    SQLALCHEMY_DATABASE_URI = Config.SQLALCHEMY_DATABASE_URI
 
 
 class DevelopmentConfig(Config):
     DEBUG = True
-    # If no online DB is set, force SQLite for local development
-    if not os.environ.get('MYSQL_URL') and not os.environ.get('DATABASE_URL'):
-        SQLALCHEMY_DATABASE_URI = f"sqlite:///{(BASE_DIR / 'instance' / 'ecommerce_dev.db')}"
+    # Inherits Config's URI: any configured database URL (MYSQL_URL,
+    # DATABASE_URL or DATABASE_URI), otherwise local SQLite.
 
 
 class TestingConfig(Config):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
 
+
+# FLASK_ENV value (and aliases) -> config class. Unknown names fall back to production.
+_CONFIG_MAPPING = {
+    "development": DevelopmentConfig,
+    "dev": DevelopmentConfig,
+    "testing": TestingConfig,
+    "test": TestingConfig,
+    "production": ProductionConfig,
+}
+
+
+@lru_cache(maxsize=8)
+def _lookup(env):
+    return _CONFIG_MAPPING.get(env, ProductionConfig)
+
+
 # Helper to load the correct class based on FLASK_ENV
 def get_config(name=None):
-    env = (name or os.getenv("FLASK_ENV", "production")).lower()
-    if env in ["development", "dev"]:
-        return DevelopmentConfig
-    if env in ["testing", "test"]:
-        return TestingConfig
-    return ProductionConfig
\ No newline at end of file
+    env = (name or _env("FLASK_ENV", "production")).lower()
+    return _lookup(env)
+
+
+@lru_cache(maxsize=8)
+def config_dict(config_class):
+    """Uppercase settings of a config class (inherited ones included), collected once."""
+    return MappingProxyType({
+        key: getattr(config_class, key) for key in dir(config_class) if key.isupper()
+    })
@@ -0,0 +1,59 @@
+import pytest
+
+from app import create_app
+from app.errors import NotFoundError, ServiceError
+
+
+@pytest.fixture
+def client():
+    app = create_app("config.TestingConfig")
+
+    @app.route("/_raise/not-found")
+    def raise_not_found():
+        raise NotFoundError("User not found", details={"user_id": 7})
+
+    @app.route("/_raise/service")
+    def raise_service():
+        raise ServiceError("Database commit failed: [SQL: INSERT INTO users ...]")
+
+    return app.test_client()
+
+
+def test_app_error_uses_error_envelope(client):
+    resp = client.get("/_raise/not-found")
+
+    assert resp.status_code == 404
+    assert resp.get_json() == {
+        "status": "error",
+        "data": None,
+        "error": {"message": "User not found", "code": "not_found", "details": {"user_id": 7}},
+        "meta": None,
+    }
+
+
+def test_service_error_hides_internal_message(client):
+    resp = client.get("/_raise/service")
+
+    assert resp.status_code == 400
+    body = resp.get_json()
+    assert body["error"] == {"message": "Service error", "code": "service_error"}
+    assert "SQL" not in resp.get_data(as_text=True)
+
+
+def test_unknown_route_returns_json_404(client):
+    resp = client.get("/does-not-exist")
+
+    assert resp.status_code == 404
+    body = resp.get_json()
+    assert body["status"] == "error"
+    assert body["data"] is None
+    assert body["error"]["code"] == "not_found"
+
+
+def test_wrong_method_returns_json_405_with_allow_header(client):
+    resp = client.post("/")
+
+    assert resp.status_code == 405
+    assert resp.get_json()["error"]["code"] == "method_not_allowed"
+    assert "GET" in resp.headers["Allow"]
+    assert resp.headers["Content-Type"] == "application/json"